@@ -65,6 +65,14 @@ autodoc_member_order = 'bysource'
 autodoc_typehints = 'description'
 autodoc_typehints_format = 'short'
 autoclass_content = 'both'
+autodoc_preserve_defaults = True  # Render defaults from source instead of repr()
+
+# Don't add a TOC entry for every documented object (slow on API-heavy pages)
+toc_object_entries = False
+
+# Only generate source pages for modules that are documented directly
+viewcode_follow_imported_members = False
+viewcode_enable_epub = False
 
 # Tell sphinx what the primary language being documented is
 primary_domain = 'py'
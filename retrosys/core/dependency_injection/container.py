@@ -2,17 +2,23 @@ from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     List,
     Optional,
+    Set,
+    Tuple,
     Type,
     Union,
     Awaitable,
 )
 
+from contextvars import ContextVar
 import inspect
+import sys
 import warnings
 import threading
 import logging
+import weakref
 
 from .project_types import (
     T,
@@ -31,6 +37,16 @@ from .lazy import Lazy
 from .scope import Scope
 from .module import Module
 
+# Types that constructor injection refuses to resolve from annotations alone
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, list, dict, tuple, set})
+
+
+def _lazy_inner(annotation: Any) -> Optional[Any]:
+    """Return the wrapped type of a ``Lazy[...]`` annotation, or None for any other."""
+    if getattr(annotation, "__origin__", None) is Lazy:
+        return annotation.__args__[0]
+    return None
+
 
 class Container:
     """Main dependency injection container with both synchronous and asynchronous support.
@@ -51,26 +67,73 @@ class Container:
 
     Attributes:
         _descriptors: Dictionary mapping service types to lists of service descriptors
-        _resolution_stack: Stack used for detecting circular dependencies during resolution
-        _lock: Thread lock for thread-safety
+        _keyed_descriptors: Index of the first descriptor registered for each
+            (service type, context key) pair
+        _default_descriptors: Index of the first descriptor registered for each service type,
+            used when no registration matches the requested context key
+        _singletons: Constructed singleton instances keyed by (service type, context key),
+            read without taking the lock
+        _resolution: Context variable holding, for the current thread or task, the chain of
+            types being resolved and a frozenset of the same types for constant-time cycle
+            checks. Both are immutable and set anew at each level, so tasks spawned during
+            a resolution work on a snapshot of them
+        _lock: Reentrant lock held by writers and while constructing singletons; lookups
+            read the lookup indexes without it
         _modules: Dictionary of registered modules by namespace
+        _parent: The container this one was created from by create_child_container, if any
+        _children: Weak set of the child containers created from this one, whose caches
+            are cleared along with this container's; None until the first child
         _logger: Logger for container events
         _test_mode: Flag indicating whether test mode is enabled
         _mock_instances: Dictionary of mock instances used in test mode
-        _signature_cache: Cache of constructor signatures for performance
+        _init_plans: Cache of constructor injection plans by implementation type
+        _trivial_types: Implementation types whose constructor takes no injected arguments
+        _lazy_dependencies: Lazy wrappers shared by every constructor that injects the same
+            singleton lazily
         _property_injection_cache: Cache of property injection metadata
         _method_injection_cache: Cache of method injection metadata
     """
 
+    __slots__ = (
+        "_descriptors",
+        "_keyed_descriptors",
+        "_default_descriptors",
+        "_singletons",
+        "_resolution",
+        "_lock",
+        "_modules",
+        "_parent",
+        "_children",
+        "_logger",
+        "_test_mode",
+        "_mock_instances",
+        "_init_plans",
+        "_trivial_types",
+        "_lazy_dependencies",
+        "_property_injection_cache",
+        "_method_injection_cache",
+        "__weakref__",
+    )
+
     def __init__(self):
         self._descriptors: Dict[Type, List[ServiceDescriptor]] = {}
-        self._resolution_stack: List[Type] = []
+        self._keyed_descriptors: Dict[Tuple[Type, str], ServiceDescriptor] = {}
+        self._default_descriptors: Dict[Type, ServiceDescriptor] = {}
+        self._singletons: Dict[Tuple[Type, str], Any] = {}
+        self._resolution: ContextVar[
+            Tuple[Tuple[Type, ...], FrozenSet[Type]]
+        ] = ContextVar(f"di_resolution_{id(self)}", default=((), frozenset())
+        )
         self._lock = threading.RLock()
         self._modules: Dict[str, "Module"] = {}
+        self._parent: Optional["Container"] = None
+        self._children: Optional["weakref.WeakSet[Container]"] = None
         self._logger = logging.getLogger("DI.Container")
         self._test_mode = False
         self._mock_instances: Dict[Type, Any] = {}
-        self._signature_cache: Dict[Type, inspect.Signature] = {}
+        self._init_plans: Dict[Type, Tuple[Tuple[str, Any, bool], ...]] = {}
+        self._trivial_types: Set[Type] = set()
+        self._lazy_dependencies: Dict[Type, Lazy] = {}
         self._property_injection_cache: Dict[Type, Dict[str, Type]] = {}
         self._method_injection_cache: Dict[Type, Dict[str, Dict[str, Type]]] = {}
 
@@ -104,6 +167,8 @@ class Container:
                 of the same type to be registered with different keys.
             is_async: Whether this service requires asynchronous initialization.
                 Set to True for services that have async dependencies or initialization logic.
+                Automatically enabled for coroutine factories, async __init__ methods
+                and async on_init hooks.
             resolution_strategy: Whether to resolve the service eagerly or lazily.
                 Defaults to ResolutionStrategy.EAGER.
             on_init: Optional callback function to invoke after a service instance is created.
@@ -116,12 +181,22 @@ class Container:
             - Creates a ServiceDescriptor and adds it to the container's registry.
             - Updates property and method injection caches if applicable.
         """
+        # Keys stored in the lookup indexes are interned, so a resolve with an
+        # identifier-like key (interned by the compiler) matches by identity.
+        # sys.intern rejects str subclasses (e.g. str-based enum members), so
+        # those are stored as given and matched by equality.
+        if type(context_key) is str:
+            context_key = sys.intern(context_key)
+
         with self._lock:
             impl_type = implementation_type or service_type
 
-            # Detect async factory
-            if factory and inspect.iscoroutinefunction(factory):
-                is_async = True
+            # Detect async factories, constructors and on_init hooks once, here, so
+            # resolution can rely on the descriptor's is_async flag
+            if not is_async:
+                is_async = inspect.iscoroutinefunction(
+                    factory if factory else impl_type.__init__
+                ) or inspect.iscoroutinefunction(on_init)
 
             descriptor = ServiceDescriptor(
                 service_type=service_type,
@@ -143,12 +218,6 @@ class Container:
                         impl_type, "__di_property_injections__", {}
                     )
 
-            # Apply cached property injections
-            for prop_name, prop_type in self._property_injection_cache[
-                impl_type
-            ].items():
-                descriptor.property_injections[prop_name] = prop_type
-
             # Cache method injections for performance
             if impl_type not in self._method_injection_cache:
                 self._method_injection_cache[impl_type] = {}
@@ -157,15 +226,13 @@ class Container:
                         impl_type, "__di_method_injections__", {}
                     )
 
-            # Apply cached method injections
-            for method_name, params in self._method_injection_cache[impl_type].items():
-                descriptor.method_injections[method_name] = params
-
-            # CRITICAL PART - FIXED INDENTATION
-            if service_type not in self._descriptors:
-                self._descriptors[service_type] = []
+            # Apply cached property and method injections
+            descriptor.bulk_update_injections(
+                self._property_injection_cache[impl_type],
+                self._method_injection_cache[impl_type],
+            )
 
-            self._descriptors[service_type].append(descriptor)
+            self._add_descriptor(descriptor)
 
         return self
 
@@ -194,10 +261,7 @@ class Container:
                 instance=instance,
             )
 
-            if service_type not in self._descriptors:
-                self._descriptors[service_type] = []
-
-            self._descriptors[service_type].append(descriptor)
+            self._add_descriptor(descriptor)
             return self
 
     def register_factory(
@@ -228,11 +292,9 @@ class Container:
             Container: The container instance for method chaining.
 
         Side Effects:
-            Automatically detects if the factory is a coroutine function and sets
-            is_async accordingly.
+            register automatically detects if the factory is a coroutine function and
+            sets is_async accordingly.
         """
-        if inspect.iscoroutinefunction(factory):
-            is_async = True
         return self.register(
             service_type,
             lifecycle=lifecycle,
@@ -257,6 +319,23 @@ class Container:
         """
         return Lazy(self, service_type, context_key)
 
+    def has_descriptor(self, service_type: Type, context_key: str = "") -> bool:
+        """Check whether a service can be found without resolving it.
+
+        The lookup follows the same rules as resolve: the context key falls back to the
+        default registration, and registered modules and the parent of a child container
+        are searched as well. Just-in-time registration of @injectable classes is not
+        considered.
+
+        Args:
+            service_type: The type of service to look up.
+            context_key: Optional key for contextual binding. Defaults to an empty string.
+
+        Returns:
+            bool: True if a registration for the service was found, False otherwise.
+        """
+        return self._get_descriptor(service_type, context_key) is not None
+
     def resolve(self, service_type: Type[T], context_key: str = "") -> T:
         """Synchronously resolve a service from the container.
 
@@ -280,142 +359,64 @@ class Container:
             - Creates and caches instances for singleton services.
             - Calls on_init lifecycle hooks for newly created instances.
         """
-        with self._lock:
-            # test mode, check for mocks first
-            if self._test_mode and service_type in self._mock_instances:
-                return self._mock_instances[service_type]
-
-            # Check for circular dependencies
-            if service_type in self._resolution_stack:
-                path = " -> ".join(
-                    [t.__name__ for t in self._resolution_stack]
-                    + [service_type.__name__]
-                )
-                raise CircularDependencyError(
-                    f"Circular dependency detected: {path}\n"
-                    f"Resolution stack (newest first):\n"
-                    + "\n".join(
-                        [
-                            f"  {i + 1}. {t.__name__}"
-                            for i, t in enumerate(reversed(self._resolution_stack))
-                        ]
-                    )
-                )
-
-            # resolution stack for circular dependency detection
-            self._resolution_stack.append(service_type)
-
-            try:
-                descriptor = self._get_descriptor(service_type, context_key)
+        # test mode, check for mocks first
+        if self._test_mode and service_type in self._mock_instances:
+            return self._mock_instances[service_type]
 
-                # Just-in-time registration for injectable classes
-                if (
-                    not descriptor
-                    and hasattr(service_type, "__di_injectable__")
-                    and getattr(service_type, "__di_injectable__")
-                ):
-                    # Extract metadata (this added from decorator)
-                    lifecycle = getattr(
-                        service_type, "__di_lifecycle__", Lifecycle.SINGLETON
-                    )
-                    ctx_key = getattr(service_type, "__di_context_key__", context_key)
-                    is_async = getattr(service_type, "__di_is_async__", False)
-                    resolution_strategy = getattr(
-                        service_type,
-                        "__di_resolution_strategy__",
-                        ResolutionStrategy.EAGER,
-                    )
-
-                    # Register automatically
-                    self.register(
-                        service_type,
-                        lifecycle=lifecycle,
-                        context_key=ctx_key,
-                        is_async=is_async,
-                        resolution_strategy=resolution_strategy,
-                    )
-
-                    # update descriptor
-                    descriptor = self._get_descriptor(service_type, context_key)
-
-                if not descriptor:
-                    raise DependencyNotFoundError(
-                        f"No registration found for {service_type.__name__}"
-                    )
-
-                if (
-                    descriptor.lifecycle == Lifecycle.SINGLETON
-                    and descriptor.instance is not None
-                ):
-                    return descriptor.instance
+        # Lock-free fast path for singletons that have already been constructed
+        instance = self._singletons.get((service_type, context_key))
+        if instance is not None:
+            return instance
 
-                # Handle async services
-                if descriptor.is_async:
-                    raise AsyncInitializationError(
-                        f"Service {service_type.__name__} is async and must be resolved with resolve_async"
-                    )
+        # Check for circular dependencies
+        resolution_chain, resolving = self._resolution.get()
+        if service_type in resolving:
+            path = " -> ".join(
+                [t.__name__ for t in resolution_chain]
+                + [service_type.__name__]
+            )
+            raise CircularDependencyError(
+                f"Circular dependency detected: {path}\n"
+                f"Resolution stack (newest first):\n"
+                + "\n".join(
+                    [
+                        f"  {i + 1}. {t.__name__}"
+                        for i, t in enumerate(reversed(resolution_chain))
+                    ]
+                )
+            )
 
-                # Use factory if provided
-                if descriptor.factory:
-                    instance = descriptor.factory(self)
-                else:
-                    # Create a new instance using constructor injection
-                    instance = self._create_instance(descriptor.implementation_type)
+        # Extend the chain for this level only; reset restores the caller's chain
+        token = self._resolution.set(
+            (resolution_chain + (service_type,), resolving | {service_type})
+        )
 
-                # Apply property injections using cache
-                impl_type = descriptor.implementation_type
-                if impl_type not in self._property_injection_cache:
-                    self._property_injection_cache[impl_type] = {}
-                    if hasattr(impl_type, "__di_property_injections__"):
-                        self._property_injection_cache[impl_type] = getattr(
-                            impl_type, "__di_property_injections__", {}
-                        )
+        try:
+            descriptor = self._get_descriptor(service_type, context_key)
+            if descriptor is None:
+                # Just-in-time registration for injectable classes
+                descriptor = self._auto_register(service_type, context_key)
 
-                for prop_name, prop_type in self._property_injection_cache[
-                    impl_type
-                ].items():
-                    try:
-                        setattr(
-                            instance, prop_name, self.resolve(prop_type, context_key)
-                        )
-                    except DependencyNotFoundError as e:
-                        raise DependencyNotFoundError(
-                            f"Failed to inject property '{prop_name}' of type {prop_type.__name__} "
-                            f"into {service_type.__name__} instance: {str(e)}",
-                            prop_type,
-                            context_key,
-                        ) from e
-
-                # Apply method injections using cache
-                if impl_type not in self._method_injection_cache:
-                    self._method_injection_cache[impl_type] = {}
-                    if hasattr(impl_type, "__di_method_injections__"):
-                        self._method_injection_cache[impl_type] = getattr(
-                            impl_type, "__di_method_injections__", {}
-                        )
+            if not descriptor:
+                raise DependencyNotFoundError(
+                    f"No registration found for {service_type.__name__}"
+                )
 
-                for method_name, param_types in self._method_injection_cache[
-                    impl_type
-                ].items():
-                    method = getattr(instance, method_name)
-                    params = {
-                        name: self.resolve(typ, context_key)
-                        for name, typ in param_types.items()
-                    }
-                    method(**params)
-
-                # Call on_init if provided
-                if descriptor.on_init and not descriptor.is_async:
-                    descriptor.on_init(instance)
+            if descriptor.lifecycle is not Lifecycle.SINGLETON:
+                return self._build(descriptor, service_type, context_key)
 
-                if descriptor.lifecycle == Lifecycle.SINGLETON:
+            # Only singleton construction takes the lock, so that each is built once
+            with self._lock:
+                instance = descriptor.instance
+                if instance is None:
+                    instance = self._build(descriptor, service_type, context_key)
                     descriptor.instance = instance
-
-                return instance
-            except DependencyNotFoundError as e:
-                raise e
-            finally:
-                self._resolution_stack.pop()
+            self._singletons[(service_type, context_key)] = instance
+            return instance
+        except DependencyNotFoundError as e:
+            raise e
+        finally:
+            self._resolution.reset(token)
 
     async def resolve_async(self, service_type: Type[T], context_key: str = "") -> T:
         """Asynchronously resolve a service from the container.
@@ -440,256 +441,401 @@ class Container:
             - Calls on_init lifecycle hooks for newly created instances.
             - Awaits async factories and async on_init hooks.
         """
-        with self._lock:
-            # test mode, check for mocks first
-            if self._test_mode and service_type in self._mock_instances:
-                return self._mock_instances[service_type]
-
-            # Check for circular dependencies
-            if service_type in self._resolution_stack:
-                path = " -> ".join(
-                    [t.__name__ for t in self._resolution_stack]
-                    + [service_type.__name__]
-                )
-                raise CircularDependencyError(f"Circular dependency detected: {path}")
+        # test mode, check for mocks first
+        if self._test_mode and service_type in self._mock_instances:
+            return self._mock_instances[service_type]
 
-            # resolution stack for circular dependency detection
-            self._resolution_stack.append(service_type)
+        # Lock-free fast path for singletons that have already been constructed
+        instance = self._singletons.get((service_type, context_key))
+        if instance is not None:
+            return instance
 
-            try:
-                descriptor = self._get_descriptor(service_type, context_key)
+        # Check for circular dependencies. No lock is held here: it would be
+        # held across the awaits below and serialize every async resolution.
+        resolution_chain, resolving = self._resolution.get()
+        if service_type in resolving:
+            path = " -> ".join(
+                [t.__name__ for t in resolution_chain]
+                + [service_type.__name__]
+            )
+            raise CircularDependencyError(f"Circular dependency detected: {path}")
+
+        # Extend the chain for this level only. Tasks spawned below (e.g. by a
+        # factory gathering several resolves) copy the context, so each gets
+        # its own snapshot of the chain rather than a shared mutable stack.
+        token = self._resolution.set(
+            (resolution_chain + (service_type,), resolving | {service_type})
+        )
 
+        try:
+            descriptor = self._get_descriptor(service_type, context_key)
+            if descriptor is None:
                 # Just-in-time registration for injectable classes
-                if (
-                    not descriptor
-                    and hasattr(service_type, "__di_injectable__")
-                    and getattr(service_type, "__di_injectable__")
-                ):
-                    # Extract metadata from the class
-                    lifecycle = getattr(
-                        service_type, "__di_lifecycle__", Lifecycle.SINGLETON
-                    )
-                    ctx_key = getattr(service_type, "__di_context_key__", context_key)
-                    is_async = getattr(service_type, "__di_is_async__", False)
-                    resolution_strategy = getattr(
-                        service_type,
-                        "__di_resolution_strategy__",
-                        ResolutionStrategy.EAGER,
-                    )
+                descriptor = self._auto_register(service_type, context_key)
 
-                    # Register it automatically
-                    self.register(
-                        service_type,
-                        lifecycle=lifecycle,
-                        context_key=ctx_key,
-                        is_async=is_async,
-                        resolution_strategy=resolution_strategy,
-                    )
+            if not descriptor:
+                raise DependencyNotFoundError(
+                    f"No registration found for {service_type.__name__}"
+                )
 
-                    descriptor = self._get_descriptor(service_type, context_key)
+            if (
+                descriptor.lifecycle is Lifecycle.SINGLETON
+                and descriptor.instance is not None
+            ):
+                self._singletons[(service_type, context_key)] = descriptor.instance
+                return descriptor.instance
 
-                if not descriptor:
-                    raise DependencyNotFoundError(
-                        f"No registration found for {service_type.__name__}"
-                    )
+            if descriptor.factory:
+                if descriptor.is_async:
+                    instance = await descriptor.factory(self)
+                else:
+                    instance = descriptor.factory(self)
+            else:
+                instance = await self._create_instance_async(
+                    descriptor.implementation_type
+                )
 
-                if (
-                    descriptor.lifecycle == Lifecycle.SINGLETON
-                    and descriptor.instance is not None
-                ):
-                    return descriptor.instance
+            # The injection maps were copied onto the descriptor at registration
+            for prop_name, prop_type in descriptor.property_injections.items():
+                prop_descriptor = self._get_descriptor(prop_type, context_key)
+                if prop_descriptor and prop_descriptor.is_async:
+                    setattr(
+                        instance,
+                        prop_name,
+                        await self.resolve_async(prop_type, context_key),
+                    )
+                else:
+                    setattr(
+                        instance, prop_name, self.resolve(prop_type, context_key)
+                    )
 
-                if descriptor.factory:
-                    if descriptor.is_async:
-                        instance = await descriptor.factory(self)
+            for method_name, param_types in descriptor.method_injections.items():
+                method = getattr(instance, method_name)
+                params = {}
+                for name, typ in param_types.items():
+                    param_descriptor = self._get_descriptor(typ, context_key)
+                    if param_descriptor and param_descriptor.is_async:
+                        params[name] = await self.resolve_async(typ, context_key)
                     else:
-                        instance = descriptor.factory(self)
+                        params[name] = self.resolve(typ, context_key)
+                method(**params)
+
+            if descriptor.on_init:
+                if descriptor.on_init_is_async:
+                    await descriptor.on_init(instance)
                 else:
-                    instance = await self._create_instance_async(
-                        descriptor.implementation_type
-                    )
+                    descriptor.on_init(instance)
 
-                impl_type = descriptor.implementation_type
-                if impl_type not in self._property_injection_cache:
-                    self._property_injection_cache[impl_type] = {}
-                    if hasattr(impl_type, "__di_property_injections__"):
-                        self._property_injection_cache[impl_type] = getattr(
-                            impl_type, "__di_property_injections__", {}
-                        )
+            if descriptor.lifecycle is Lifecycle.SINGLETON:
+                # Another task or thread may have built the singleton while this
+                # one was awaiting; the first one published wins. The lock covers
+                # only this check-then-store and is never held across an await.
+                with self._lock:
+                    if descriptor.instance is None:
+                        descriptor.instance = instance
+                    instance = descriptor.instance
+                self._singletons[(service_type, context_key)] = instance
 
-                for prop_name, prop_type in self._property_injection_cache[
-                    impl_type
-                ].items():
-                    prop_descriptor = self._get_descriptor(prop_type, context_key)
-                    if prop_descriptor and prop_descriptor.is_async:
-                        setattr(
-                            instance,
-                            prop_name,
-                            await self.resolve_async(prop_type, context_key),
-                        )
-                    else:
-                        setattr(
-                            instance, prop_name, self.resolve(prop_type, context_key)
-                        )
+            return instance
+        finally:
+            # Restore the caller's resolution chain
+            self._resolution.reset(token)
 
-                if impl_type not in self._method_injection_cache:
-                    self._method_injection_cache[impl_type] = {}
-                    if hasattr(impl_type, "__di_method_injections__"):
-                        self._method_injection_cache[impl_type] = getattr(
-                            impl_type, "__di_method_injections__", {}
-                        )
+    def _auto_register(
+        self, service_type: Type, context_key: str = ""
+    ) -> Optional[ServiceDescriptor]:
+        """Register an @injectable class on first use.
 
-                for method_name, param_types in self._method_injection_cache[
-                    impl_type
-                ].items():
-                    method = getattr(instance, method_name)
-                    params = {}
-                    for name, typ in param_types.items():
-                        param_descriptor = self._get_descriptor(typ, context_key)
-                        if param_descriptor and param_descriptor.is_async:
-                            params[name] = await self.resolve_async(typ, context_key)
-                        else:
-                            params[name] = self.resolve(typ, context_key)
-                    method(**params)
-
-                if descriptor.on_init:
-                    if descriptor.is_async:
-                        await descriptor.on_init(instance)
-                    else:
-                        descriptor.on_init(instance)
+        Args:
+            service_type: The unregistered type being resolved.
+            context_key: The context key the type is being resolved with.
 
-                if descriptor.lifecycle == Lifecycle.SINGLETON:
-                    descriptor.instance = instance
+        Returns:
+            The descriptor to resolve with, or None if the type is not injectable.
+        """
+        meta = getattr(service_type, "__di_meta__", None)
+        if meta is None:
+            return None
 
-                return instance
-            finally:
-                # Remove from resolution stack
-                self._resolution_stack.pop()
+        # Register automatically using the decorator's metadata
+        self.register(
+            service_type,
+            lifecycle=meta.lifecycle,
+            context_key=meta.context_key,
+            is_async=meta.is_async,
+            resolution_strategy=meta.resolution_strategy,
+        )
+        return self._get_descriptor(service_type, context_key)
+
+    def _build(
+        self, descriptor: ServiceDescriptor, service_type: Type[T], context_key: str
+    ) -> T:
+        """Create and initialize a new instance for a descriptor.
+
+        Runs the factory or constructor injection, applies property and method
+        injections and calls the on_init hook. Caching the result is left to the caller.
+        """
+        # Handle async services
+        if descriptor.is_async:
+            raise AsyncInitializationError(
+                f"Service {service_type.__name__} is async and must be resolved with resolve_async"
+            )
+
+        # Use factory if provided
+        if descriptor.factory:
+            instance = descriptor.factory(self)
+        else:
+            # Create a new instance using constructor injection
+            instance = self._create_instance(descriptor.implementation_type)
+
+        # Apply property injections; the injection maps were copied onto the
+        # descriptor at registration, so there is nothing to look up here
+        for prop_name, prop_type in descriptor.property_injections.items():
+            try:
+                setattr(
+                    instance, prop_name, self.resolve(prop_type, context_key)
+                )
+            except DependencyNotFoundError as e:
+                raise DependencyNotFoundError(
+                    f"Failed to inject property '{prop_name}' of type {prop_type.__name__} "
+                    f"into {service_type.__name__} instance: {str(e)}",
+                    prop_type,
+                    context_key,
+                ) from e
+
+        # Apply method injections
+        for method_name, param_types in descriptor.method_injections.items():
+            method = getattr(instance, method_name)
+            params = {
+                name: self.resolve(typ, context_key)
+                for name, typ in param_types.items()
+            }
+            method(**params)
+
+        # Call on_init if provided; async hooks made the service async above
+        if descriptor.on_init:
+            descriptor.on_init(instance)
+
+        return instance
+
+    def _add_descriptor(self, descriptor: ServiceDescriptor) -> None:
+        """Add a descriptor to the registry and its lookup indexes."""
+        service_type = descriptor.service_type
+        self._descriptors.setdefault(service_type, []).append(descriptor)
+
+        # The first registration wins for both the contextual and the default
+        # lookup. Writers hold the lock; resolve only calls get() on the indexes,
+        # and a single-key store is atomic, so readers need no lock.
+        key = (service_type, descriptor.context_key)
+        if key not in self._keyed_descriptors:
+            self._keyed_descriptors[key] = descriptor
+        if service_type not in self._default_descriptors:
+            self._default_descriptors[service_type] = descriptor
+
+        # A new registration can change what a cached key resolves to (and so
+        # what a shared Lazy wraps), and which forward references the
+        # constructor plans can see
+        self._clear_caches()
+
+    def _clear_caches(self) -> None:
+        """Drop the caches derived from the registry, here and in child containers.
+
+        Children look up missing registrations in their parent, so a change to the
+        parent's registry can change what their cached entries should resolve to.
+        """
+        self._singletons.clear()
+        self._init_plans.clear()
+        self._lazy_dependencies.clear()
+        children = self._children
+        if children is not None:
+            for child in list(children):
+                child._clear_caches()
 
     def _get_descriptor(
         self, service_type: Type, context_key: str = ""
     ) -> Optional[ServiceDescriptor]:
         """Get the service descriptor for a type."""
-        descriptors = self._descriptors.get(service_type, [])
-        if not descriptors:
+        # Find the appropriate descriptor based on context
+        # Lock-free: _add_descriptor only ever adds single keys to the indexes
+        key = (service_type, context_key)
+        descriptor = self._keyed_descriptors.get(key)
+        if descriptor is not None:
+            return descriptor
+
+        # An exact context key match anywhere up the parent chain beats any
+        # default registration, including this container's own
+        parent = self._parent
+        while parent is not None:
+            descriptor = parent._keyed_descriptors.get(key)
+            if descriptor is not None:
+                return descriptor
+            parent = parent._parent
+
+        container: Optional[Container] = self
+        while container is not None:
+            descriptor = container._default_descriptors.get(service_type)
+            if descriptor is not None:
+                return descriptor
+
             # Check if it's registered in any modules
-            for module in self._modules.values():
+            for module in container._modules.values():
                 descriptor = module._container._get_descriptor(
                     service_type, context_key
                 )
                 if descriptor:
                     return descriptor
-            return None
 
-        # Find the appropriate descriptor based on context
-        return next(
-            (d for d in descriptors if d.context_key == context_key), descriptors[0]
-        )
+            # Fall back to the parent of a child container
+            container = container._parent
+        return None
+
+    def _registered_types(self) -> List[Type]:
+        """Get the types registered here and in parent containers, nearest first."""
+        registered = []
+        container: Optional[Container] = self
+        while container is not None:
+            registered.extend(container._descriptors)
+            container = container._parent
+        return registered
+
+    def _get_init_plan(
+        self, implementation_type: Type
+    ) -> Tuple[Tuple[str, Any, bool], ...]:
+        """Get the constructor injection plan for an implementation type.
+
+        The plan is the sequence of ``(parameter name, dependency type, is_lazy)``
+        entries that must be injected into ``__init__``. For ``Lazy[T]`` parameters the
+        dependency type is ``T`` and ``is_lazy`` is True. The plan is built from the
+        constructor signature once per type, with forward references resolved and
+        defaulted parameters skipped, and is reused until the next registration
+        changes the registry. Child containers with no registrations of their own
+        reuse their parent's plans.
 
-    def _create_instance(self, implementation_type: Type[T]) -> T:
-        """Create a new instance with constructor injection."""
-        try:
-            if not hasattr(implementation_type, "__init__"):
-                instance = implementation_type()
-                # set container reference for property injections
-                setattr(instance, "_container", self)
-                # Apply property injections after construction
-                self._apply_property_injections(instance, implementation_type)
-                return instance
-
-            # Get the constructor
-            init = implementation_type.__init__
-            if init is object.__init__:  # Default constructor
-                instance = implementation_type()
-                # set container reference for property injections
-                setattr(instance, "_container", self)
-                # Apply property injections after construction
-                self._apply_property_injections(instance, implementation_type)
-                return instance
+        Raises:
+            DependencyNotFoundError: If a parameter has no type annotation, its forward
+                reference cannot be resolved, or it is a primitive type.
+        """
+        plan = self._init_plans.get(implementation_type)
+        if plan is not None:
+            return plan
+
+        # A child without registrations of its own (such as a scope's) sees the
+        # same types as its parent, so it shares the parent's plans rather than
+        # inspecting each constructor again
+        if self._parent is not None and not self._descriptors:
+            return self._parent._get_init_plan(implementation_type)
+
+        sig = inspect.signature(implementation_type.__init__)
+        plan = []
+
+        for name, param in sig.parameters.items():
+            if name == "self":
+                continue
+
+            # Skip parameters with default values
+            if param.default is not inspect.Parameter.empty:
+                continue  # Parameter has default, don't inject it
+
+            annotation = param.annotation
+            if annotation is inspect.Parameter.empty:
+                # Cannot resolve parameter without type annotation
+                raise DependencyNotFoundError(
+                    f"Cannot resolve parameter '{name}' for {implementation_type.__name__} "
+                    f"without type annotation"
+                )
 
-            # Get parameter annotations using cached signature
-            if implementation_type not in self._signature_cache:
-                self._signature_cache[implementation_type] = inspect.signature(init)
+            # Handle string annotations (forward references)
+            if isinstance(annotation, str):
+                # Try multiple resolution strategies
 
-            sig = self._signature_cache[implementation_type]
-            params = {}
+                resolved = False
 
-            for name, param in sig.parameters.items():
-                if name == "self":
-                    continue
+                # 1. check if any registered type has this name, looking
+                # through the parent chain as well
+                registered_types = self._registered_types()
+                for registered_type in registered_types:
+                    if registered_type.__name__ == annotation:
+                        annotation = registered_type
+                        resolved = True
+                        break
 
-                # Skip parameters with default values
-                if param.default is not inspect.Parameter.empty:
-                    continue  # Parameter has default, don't inject it
+                # 2. evaluate in module context
+                if not resolved:
+                    impl_module = inspect.getmodule(implementation_type)
+                    try:
+                        if impl_module:
+                            # Add registered types to evaluation context; nearer
+                            # containers' types are added last so they win
+                            module_dict = impl_module.__dict__.copy()
+                            for service_type in reversed(registered_types):
+                                module_dict[service_type.__name__] = service_type
+
+                            # Try to evaluate
+                            annotation = eval(
+                                annotation,
+                                module_dict,
+                                implementation_type.__dict__,
+                            )
+                            resolved = True
+                    except (NameError, SyntaxError):
+                        pass  # Will be handled in the next check
 
-                annotation = param.annotation
-                if annotation is inspect.Parameter.empty:
-                    # Cannot resolve parameter without type annotation
+                # If we still couldn't resolve it
+                if not resolved:
                     raise DependencyNotFoundError(
-                        f"Cannot resolve parameter '{name}' for {implementation_type.__name__} "
-                        f"without type annotation"
+                        f"Cannot resolve forward reference '{annotation}' for parameter '{name}' "
+                        f"in {implementation_type.__name__}.__init__"
                     )
 
-                # Handle string annotations (forward references)
-                if isinstance(annotation, str):
-                    # Try multiple resolution strategies
+            # Check for primitive types
+            if annotation in _PRIMITIVE_TYPES:
+                raise DependencyNotFoundError(
+                    f"Cannot automatically resolve primitive type '{annotation.__name__}' for parameter '{name}' "
+                    f"in {implementation_type.__name__}.__init__. Consider using a factory, "
+                    f"providing a default value, or registering the primitive type."
+                )
 
-                    resolved = False
+            # Decide once whether this is a lazy dependency
+            lazy_target = _lazy_inner(annotation)
+            if lazy_target is not None:
+                plan.append((name, lazy_target, True))
+            else:
+                plan.append((name, annotation, False))
 
-                    # 1. check if any registered type has this name
-                    for registered_type in self._descriptors:
-                        if registered_type.__name__ == annotation:
-                            annotation = registered_type
-                            resolved = True
-                            break
+        plan = tuple(plan)
+        self._init_plans[implementation_type] = plan
+        return plan
 
-                    # 2. evaluate in module context
-                    if not resolved:
-                        impl_module = inspect.getmodule(implementation_type)
-                        try:
-                            if impl_module:
-                                # Add registered types to evaluation context
-                                module_dict = impl_module.__dict__.copy()
-                                for service_type in self._descriptors:
-                                    module_dict[service_type.__name__] = service_type
-
-                                # Try to evaluate
-                                annotation = eval(
-                                    annotation,
-                                    module_dict,
-                                    implementation_type.__dict__,
-                                )
-                                resolved = True
-                        except (NameError, SyntaxError):
-                            pass  # Will be handled in the next check
-
-                    # If we still couldn't resolve it
-                    if not resolved:
-                        raise DependencyNotFoundError(
-                            f"Cannot resolve forward reference '{annotation}' for parameter '{name}' "
-                            f"in {implementation_type.__name__}.__init__"
-                        )
+    def _create_instance(self, implementation_type: Type[T]) -> T:
+        """Create a new instance with constructor injection."""
+        try:
+            if implementation_type in self._trivial_types:
+                # Nothing to inject into the constructor: call the class directly
+                instance = implementation_type()
+            else:
+                init = implementation_type.__init__
+                plan = (
+                    ()
+                    if init is object.__init__  # Default constructor
+                    else self._get_init_plan(implementation_type)
+                )
+                if not plan and not inspect.iscoroutinefunction(init):
+                    self._trivial_types.add(implementation_type)
 
-                # Check for primitive types
-                primitive_types = (str, int, float, bool, list, dict, tuple, set)
-                if annotation in primitive_types:
-                    raise DependencyNotFoundError(
-                        f"Cannot automatically resolve primitive type '{annotation.__name__}' for parameter '{name}' "
-                        f"in {implementation_type.__name__}.__init__. Consider using a factory, "
-                        f"providing a default value, or registering the primitive type."
-                    )
+                params = {}
+                for name, dependency_type, is_lazy in plan:
+                    if is_lazy:
+                        params[name] = self._lazy_dependency(dependency_type)
+                    else:
+                        # Regular dependency
+                        params[name] = self.resolve(dependency_type)
 
-                # Check if this is a lazy dependency
-                if getattr(annotation, "__origin__", None) == Lazy:
-                    params[name] = self.lazy_resolve(annotation.__args__[0])
-                else:
-                    # Regular dependency
-                    params[name] = self.resolve(annotation)
+                instance = implementation_type(**params)
 
-            instance = implementation_type(**params)
+            # set container reference for property injections
             setattr(instance, "_container", self)
 
-            # Apply property injections
+            # Apply property injections after construction
             self._apply_property_injections(instance, implementation_type)
 
             return instance
@@ -698,6 +844,26 @@ class Container:
                 f"Error creating instance of {implementation_type.__name__}: {str(e)}"
             ) from e
 
+    def _lazy_dependency(self, service_type: Type[T]) -> Lazy[T]:
+        """Get the Lazy wrapper for a constructor dependency.
+
+        A Lazy around a singleton always yields the same instance, so one wrapper is
+        shared by all constructors that inject it. Other lifecycles get a new wrapper
+        per injection, each resolving and caching its own instance. In test mode no
+        wrapper is shared, since a shared one would keep returning whatever it
+        resolved before a mock was registered or removed.
+        """
+        if self._test_mode:
+            return Lazy(self, service_type)
+
+        lazy = self._lazy_dependencies.get(service_type)
+        if lazy is None:
+            lazy = Lazy(self, service_type)
+            descriptor = self._get_descriptor(service_type)
+            if descriptor is not None and descriptor.lifecycle is Lifecycle.SINGLETON:
+                self._lazy_dependencies[service_type] = lazy
+        return lazy
+
     def _apply_property_injections(self, instance: Any, impl_type: Type) -> None:
         """Apply property injections to an instance.
         This is extracted to a separate method for clarity and reuse."""
@@ -730,97 +896,41 @@ class Container:
     async def _create_instance_async(self, implementation_type: Type[T]) -> T:
         """Create a new instance with constructor injection, supporting async dependencies."""
         try:
-            # Check if __init__ is an async method
-            init_is_async = False
-            if hasattr(implementation_type, "__init__"):
-                init = implementation_type.__init__
-                if inspect.iscoroutinefunction(init):
-                    init_is_async = True
+            # Handle classes with a default or dependency-free sync __init__
+            if implementation_type in self._trivial_types:
+                instance = implementation_type()
+                setattr(instance, "_container", self)
+                return instance
 
-            # Handle classes without __init__ or with the default __init__
-            if not hasattr(implementation_type, "__init__") or implementation_type.__init__ is object.__init__:
+            init = implementation_type.__init__
+            if init is object.__init__:
+                self._trivial_types.add(implementation_type)
                 instance = implementation_type()
                 setattr(instance, "_container", self)
                 return instance
 
-            # Get parameter annotations using cached signature
-            if implementation_type not in self._signature_cache:
-                self._signature_cache[implementation_type] = inspect.signature(init)
+            # Check if __init__ is an async method
+            init_is_async = inspect.iscoroutinefunction(init)
 
-            sig = self._signature_cache[implementation_type]
             params = {}
-
-            for name, param in sig.parameters.items():
-                if name == "self":
-                    continue
-
-                # Skip parameters with default values
-                if param.default is not inspect.Parameter.empty:
-                    continue  # Parameter has default, don't inject it
-
-                annotation = param.annotation
-                if annotation is inspect.Parameter.empty:
-                    # Cannot resolve parameter without type annotation
-                    raise DependencyNotFoundError(
-                        f"Cannot resolve parameter '{name}' for {implementation_type.__name__} "
-                        f"without type annotation"
-                    )
-
-                # Handle string annotations (forward references)
-                if isinstance(annotation, str):
-                    resolved = False
-
-                    for registered_type in self._descriptors:
-                        if registered_type.__name__ == annotation:
-                            annotation = registered_type
-                            resolved = True
-                            break
-
-                    if not resolved:
-                        impl_module = inspect.getmodule(implementation_type)
-                        try:
-                            if impl_module:
-                                module_dict = impl_module.__dict__.copy()
-                                for service_type in self._descriptors:
-                                    module_dict[service_type.__name__] = service_type
-
-                                annotation = eval(
-                                    annotation,
-                                    module_dict,
-                                    implementation_type.__dict__,
-                                )
-                                resolved = True
-                        except (NameError, SyntaxError):
-                            pass
-
-                    if not resolved:
-                        raise DependencyNotFoundError(
-                            f"Cannot resolve forward reference '{annotation}' for parameter '{name}' "
-                            f"in {implementation_type.__name__}.__init__"
-                        )
-
-                primitive_types = (str, int, float, bool, list, dict, tuple, set)
-                if annotation in primitive_types:
-                    raise DependencyNotFoundError(
-                        f"Cannot automatically resolve primitive type '{annotation.__name__}' for parameter '{name}' "
-                        f"in {implementation_type.__name__}.__init__. Consider using a factory, "
-                        f"providing a default value, or registering the primitive type."
-                    )
-
-                if getattr(annotation, "__origin__", None) == Lazy:
-                    params[name] = self.lazy_resolve(annotation.__args__[0])
+            plan = self._get_init_plan(implementation_type)
+            if not plan and not init_is_async:
+                self._trivial_types.add(implementation_type)
+            for name, dependency_type, is_lazy in plan:
+                if is_lazy:
+                    params[name] = self._lazy_dependency(dependency_type)
                 else:
                     # Get the descriptor to check if it's async
-                    descriptor = self._get_descriptor(annotation)
+                    descriptor = self._get_descriptor(dependency_type)
                     if descriptor and descriptor.is_async:
                         # The key fix: always use resolve_async for async dependencies
-                        params[name] = await self.resolve_async(annotation)
+                        params[name] = await self.resolve_async(dependency_type)
                     else:
                         try:
-                            params[name] = self.resolve(annotation)
+                            params[name] = self.resolve(dependency_type)
                         except AsyncInitializationError:
                             # Handle the case where the service is async but not marked as such
-                            params[name] = await self.resolve_async(annotation)
+                            params[name] = await self.resolve_async(dependency_type)
 
             # Create the instance - handle async __init__ properly
             if init_is_async:
@@ -880,12 +990,10 @@ class Container:
             )
         self._modules[namespace] = module
         module.parent_container = self
+        self._clear_caches()
 
         # Copy module registrations to parent container with proper handling of injections
-        for service_type, descriptors in module._container._descriptors.items():
-            if service_type not in self._descriptors:
-                self._descriptors[service_type] = []
-
+        for descriptors in module._container._descriptors.values():
             # Add descriptors from module to parent container
             for descriptor in descriptors:
                 # Create a copy of the descriptor to avoid reference issues
@@ -902,16 +1010,17 @@ class Container:
                     on_destroy=descriptor.on_destroy,
                 )
 
-                # Copy property injections
-                for prop_name, prop_type in descriptor.property_injections.items():
-                    parent_descriptor.property_injections[prop_name] = prop_type
-
-                # Copy method injections
-                for method_name, params in descriptor.method_injections.items():
-                    parent_descriptor.method_injections[method_name] = params.copy()
+                # Copy property and method injections
+                parent_descriptor.bulk_update_injections(
+                    descriptor.property_injections,
+                    {
+                        method_name: params.copy()
+                        for method_name, params in descriptor.method_injections.items()
+                    },
+                )
 
                 # Add to parent container
-                self._descriptors[service_type].append(parent_descriptor)
+                self._add_descriptor(parent_descriptor)
 
                 # Update cache
                 impl_type = descriptor.implementation_type
@@ -944,19 +1053,20 @@ class Container:
         but can have its own registrations that override the parent's. This allows for
         creating isolated dependency graphs that still have access to shared services.
 
+        Nothing is copied: lookups that miss in the child fall through to the parent,
+        so registrations made on the parent later are visible to the child as well.
+        The parent tracks its children weakly and clears their caches whenever its
+        own registry changes.
+
         Returns:
             Container: A new container instance that inherits registrations from this container.
-
-        Side Effects:
-            Copies all registrations and module references from the parent to the child container.
         """
         child = Container()
-        # Copy registrations
-        for service_type, descriptors in self._descriptors.items():
-            child._descriptors[service_type] = descriptors.copy()
-        # Copy modules
-        for namespace, module in self._modules.items():
-            child._modules[namespace] = module
+        child._parent = self
+        with self._lock:
+            if self._children is None:
+                self._children = weakref.WeakSet()
+            self._children.add(child)
         return child
 
     def enable_test_mode(self) -> "Container":
@@ -970,9 +1080,11 @@ class Container:
             Container: The container instance for method chaining.
 
         Side Effects:
-            Sets the test_mode flag to True.
+            - Sets the test_mode flag to True.
+            - Drops the shared Lazy wrappers, which may hold real instances.
         """
         self._test_mode = True
+        self._lazy_dependencies.clear()
         return self
 
     def disable_test_mode(self) -> "Container":
@@ -988,9 +1100,11 @@ class Container:
         Side Effects:
             - Sets the test_mode flag to False.
             - Clears the mock_instances dictionary.
+            - Drops the shared Lazy wrappers, which may hold mock instances.
         """
         self._test_mode = False
         self._mock_instances.clear()
+        self._lazy_dependencies.clear()
         return self
 
     def mock(self, service_type: Type[T], instance: T) -> "Container":
@@ -1008,9 +1122,11 @@ class Container:
             Container: The container instance for method chaining.
 
         Side Effects:
-            Adds the mock instance to the _mock_instances dictionary.
+            - Adds the mock instance to the _mock_instances dictionary.
+            - Drops the shared Lazy wrappers, so none keeps the replaced instance.
         """
         self._mock_instances[service_type] = instance
+        self._lazy_dependencies.clear()
         return self
 
     async def dispose(self) -> None:
@@ -1022,7 +1138,7 @@ class Container:
 
         For each singleton service with an on_destroy handler, this method will:
         - Call the on_destroy handler synchronously if it's not async
-        - Await the on_destroy handler if it's async
+        - Await the on_destroy handler if it, or the service, is async
 
         Returns:
             None
@@ -1034,11 +1150,11 @@ class Container:
         for descriptors in self._descriptors.values():
             for descriptor in descriptors:
                 if (
-                    descriptor.lifecycle == Lifecycle.SINGLETON
+                    descriptor.lifecycle is Lifecycle.SINGLETON
                     and descriptor.instance
                     and descriptor.on_destroy
                 ):
-                    if descriptor.is_async:
+                    if descriptor.on_destroy_is_async:
                         await descriptor.on_destroy(descriptor.instance)
                     else:
                         descriptor.on_destroy(descriptor.instance)
@@ -1,8 +1,50 @@
 import functools
-from typing import Type, Dict
+from typing import Type, Dict, NamedTuple
 import inspect
 from .project_types import Lifecycle, ResolutionStrategy
+from .errors import (
+    CircularDependencyError,
+    DependencyNotFoundError,
+    AsyncInitializationError,
+)
 from .module import Module
+from .container import Container
+
+
+class _DIMeta(NamedTuple):
+    """Registration metadata attached to a class by :func:`injectable`."""
+
+    lifecycle: Lifecycle
+    context_key: str
+    is_async: bool
+    resolution_strategy: ResolutionStrategy
+
+
+# Instance attributes where an injected method looks for its container
+_CONTAINER_ATTRS = ("_container", "_di_container", "__container__")
+
+
+def _find_container(instance):
+    """Return the container attached to an instance, or None if there is none."""
+    inst_dict = getattr(instance, "__dict__", None)
+    if inst_dict:
+        for attr_name in _CONTAINER_ATTRS:
+            container = inst_dict.get(attr_name)
+            if container is not None:
+                return container
+    return None
+
+
+# Shared container for injected methods called on instances without one
+_fallback_container = None
+
+
+def _get_fallback_container():
+    """Return the shared container used when an instance carries none."""
+    global _fallback_container
+    if _fallback_container is None:
+        _fallback_container = Container()
+    return _fallback_container
 
 
 def injectable(
@@ -28,26 +70,28 @@ def injectable(
         A decorator function that attaches DI metadata to the decorated class.
 
     Side Effects:
-        Sets the following attributes on the decorated class:
-        - __di_injectable__: Marker indicating the class is injectable
-        - __di_lifecycle__: The lifecycle strategy
-        - __di_context_key__: The context key for disambiguating registrations
-        - __di_is_async__: Whether the class requires async initialization
-        - __di_resolution_strategy__: The resolution strategy
+        Sets a single ``__di_meta__`` attribute on the decorated class, a named
+        tuple holding:
+        - lifecycle: The lifecycle strategy
+        - context_key: The context key for disambiguating registrations
+        - is_async: Whether the class requires async initialization
+        - resolution_strategy: The resolution strategy
         Also auto-detects async initialization based on the __init__ method.
     """
 
     def decorator(cls):
-        # Store DI metadata on the class
-        setattr(cls, "__di_injectable__", True)
-        setattr(cls, "__di_lifecycle__", lifecycle)
-        setattr(cls, "__di_context_key__", context_key)
-        setattr(cls, "__di_is_async__", is_async)
-        setattr(cls, "__di_resolution_strategy__", resolution_strategy)
+        # Auto-detect async initialization from the constructor's code flags;
+        # C-level constructors such as object.__init__ have no __code__
+        init_code = getattr(cls.__init__, "__code__", None)
+        is_async_final = is_async or (
+            init_code is not None
+            and init_code.co_flags & inspect.CO_COROUTINE != 0
+        )
 
-        # Auto-detect async initialization
-        if hasattr(cls, "__init__") and inspect.iscoroutinefunction(cls.__init__):
-            setattr(cls, "__di_is_async__", True)
+        # Store DI metadata on the class
+        cls.__di_meta__ = _DIMeta(
+            lifecycle, context_key, is_async_final, resolution_strategy
+        )
 
         return cls
 
@@ -81,40 +125,45 @@ def inject_property(service_type: Type):
         prop_name = prop_fn.__name__
 
         class PropertyDescriptor:
+            __slots__ = ("service_type", "prop_name", "backing_field")
+
             def __init__(self):
                 self.service_type = service_type
+                self.prop_name = prop_name
+                self.backing_field = f"_{prop_name}"
 
             def __get__(self, obj, objtype=None):
                 if obj is None:  # Class access
                     return self
 
-                # Get the backing field
-                backing_field = f"_{prop_name}"
-
-                # Create backing field if it doesn't exist
-                if not hasattr(obj, backing_field):
-                    setattr(obj, backing_field, None)
-
-                value = getattr(obj, backing_field, None)
+                inst_dict = obj.__dict__
+                value = inst_dict.get(self.backing_field)
+                if value is not None:
+                    return value
 
                 # If property not yet injected and we have a container,
                 # try to resolve from container
-                if value is None and hasattr(obj, "_container"):
-                    container = getattr(obj, "_container")
-                    try:
-                        resolved_value = container.resolve(service_type)
-                        setattr(obj, backing_field, resolved_value)
-                        return resolved_value
-                    except Exception:
-                        # Fall back to returning None if resolution fails
-                        pass
-
+                container = inst_dict.get("_container")
+                if container is None:
+                    return None
+                try:
+                    value = container.resolve(self.service_type)
+                except (
+                    DependencyNotFoundError,
+                    CircularDependencyError,
+                    AsyncInitializationError,
+                ):
+                    # Fall back to returning None if resolution fails
+                    return None
+                inst_dict[self.backing_field] = value
                 return value
 
             def __set__(self, obj, value):
-                setattr(obj, f"_{prop_name}", value)
+                obj.__dict__[self.backing_field] = value
 
             def __set_name__(self, owner, name):
+                self.prop_name = name
+                self.backing_field = f"_{name}"
                 if not hasattr(owner, "__di_property_injections__"):
                     setattr(owner, "__di_property_injections__", {})
                 getattr(owner, "__di_property_injections__")[name] = service_type
@@ -151,34 +200,26 @@ def inject_method(params: Dict[str, Type]):
     def decorator(method):
         # method_name = method.__name__
         # sig = inspect.signature(method)
+        params_items = tuple(params.items())
 
         @functools.wraps(method)
         def wrapper(self, **kwargs):
             method_params = {}
+            container = None
 
             # Inject dependencies that aren't provided in kwargs
-            for param_name, param_type in params.items():
+            for param_name, param_type in params_items:
                 if param_name not in kwargs:
-                    # Try to get the container from the instance's context
-                    container = None
-
-                    # Look for container in predefined locations
-                    for attr_name in ["_container", "_di_container", "__container__"]:
-                        if hasattr(self, attr_name):
-                            container = getattr(self, attr_name)
-                            break
-
-                    # If we have a container, resolve the dependency
-                    if container:
-                        method_params[param_name] = container.resolve(param_type)
-                    else:
-                        # Without container, try to lookup from registry if registered
-                        from retrosys.core.dependency_injection.container import (
-                            Container,
+                    # Try to get the container from the instance's context,
+                    # looking it up once per call. Without one, fall back to
+                    # the shared container, which can still resolve
+                    # @injectable classes just in time.
+                    if container is None:
+                        container = (
+                            _find_container(self) or _get_fallback_container()
                         )
 
-                        c = Container()
-                        method_params[param_name] = c.resolve(param_type)
+                    method_params[param_name] = container.resolve(param_type)
 
             # Combine with explicitly provided parameters
             method_params.update(kwargs)
@@ -208,6 +249,7 @@ def register_module(container):
     all of its member classes that have been marked as injectable using the @injectable
     decorator. It creates a Module instance and registers all discovered injectable
     components with that module, then registers the module with the provided container.
+    Member classes inherited from base classes of the module class are included.
 
     Args:
         container: The dependency injection container to register the module with.
@@ -239,40 +281,30 @@ def register_module(container):
 
         module = Module(module_class.__name__)
 
-        # Find all injectable members
-        for name, member in inspect.getmembers(module_class):
-            if inspect.isclass(member) and getattr(member, "__di_injectable__", False):
-                lifecycle = getattr(member, "__di_lifecycle__", Lifecycle.SINGLETON)
-                context_key = getattr(member, "__di_context_key__", "")
-                is_async = getattr(member, "__di_is_async__", False)
-                resolution_strategy = getattr(
-                    member, "__di_resolution_strategy__", ResolutionStrategy.EAGER
-                )
-
-                # Register the service
-                module.register(
-                    member,
-                    lifecycle=lifecycle,
-                    context_key=context_key,
-                    is_async=is_async,
-                    resolution_strategy=resolution_strategy,
-                )
-
-                # Add property injections if they exist - FIX: properly look up the descriptor
-                property_injections = getattr(member, "__di_property_injections__", {})
-                if property_injections:
-                    descriptor = module._container._get_descriptor(member)
-                    if descriptor:
-                        for prop_name, prop_type in property_injections.items():
-                            descriptor.property_injections[prop_name] = prop_type
-
-                # Add method injections
-                method_injections = getattr(member, "__di_method_injections__", {})
-                if method_injections:
-                    descriptor = module._container._get_descriptor(member)
-                    if descriptor:
-                        for method_name, params in method_injections.items():
-                            descriptor.method_injections[method_name] = params
+        # Find all injectable members, including those inherited from base
+        # module classes. Namespaces are scanned along the MRO (object aside),
+        # and a name defined by a subclass hides the same name further up.
+        seen_names = set()
+        for klass in module_class.__mro__[:-1]:
+            for name, member in vars(klass).items():
+                if name in seen_names:
+                    continue
+                seen_names.add(name)
+                if not isinstance(member, type):
+                    continue
+                # Inherited metadata counts, as in just-in-time registration:
+                # an undecorated subclass of an injectable class is injectable
+                meta = getattr(member, "__di_meta__", None)
+                if meta is not None:
+                    # Register the service. Container.register copies the class's
+                    # property and method injection maps onto the new descriptor.
+                    module.register(
+                        member,
+                        lifecycle=meta.lifecycle,
+                        context_key=meta.context_key,
+                        is_async=meta.is_async,
+                        resolution_strategy=meta.resolution_strategy,
+                    )
 
         # Register the module with the container
         container.register_module(module)
@@ -1,6 +1,10 @@
-from typing import Generic, Type
+import sys
+from typing import Any, Generic, Type
 from .project_types import T, ContainerProtocol
 
+# Marks a Lazy whose service has not been resolved yet; None is a valid instance
+_UNRESOLVED: Any = object()
+
 
 class Lazy(Generic[T]):
     """Wrapper for lazy dependency resolution.
@@ -14,8 +18,7 @@ class Lazy(Generic[T]):
         _container: The dependency injection container used to resolve the service.
         _service_type: The type of service to be lazily resolved.
         _context_key: Optional key for contextual binding.
-        _instance: Cached instance of the resolved service (None until resolved).
-        _resolved: Flag indicating whether the service has been resolved.
+        _instance: Cached instance of the resolved service (_UNRESOLVED until resolved).
 
     Usage:
         # As a variable
@@ -27,6 +30,14 @@ class Lazy(Generic[T]):
         service_instance = await lazy_service.async_resolve()
     """
 
+    __slots__ = (
+        "_container",
+        "_service_type",
+        "_context_key",
+        "_instance",
+        "__weakref__",
+    )
+
     def __init__(
         self, container: ContainerProtocol, service_type: Type[T], context_key: str = ""
     ):
@@ -39,9 +50,16 @@ class Lazy(Generic[T]):
         """
         self._container = container
         self._service_type = service_type
-        self._context_key = context_key
-        self._instance = None
-        self._resolved = False
+        # Non-empty keys are interned like the container's registered keys, so
+        # every later resolve matches the index key by identity. "" is already
+        # interned, and constructor injection always passes it, so skip the call.
+        # sys.intern rejects str subclasses (e.g. str-based enum members).
+        self._context_key = (
+            sys.intern(context_key)
+            if context_key and type(context_key) is str
+            else context_key
+        )
+        self._instance: Any = _UNRESOLVED
 
     def __call__(self) -> T:
         """Resolve the dependency when the lazy object is called.
@@ -56,12 +74,11 @@ class Lazy(Generic[T]):
         Side Effects:
             Resolves the dependency and caches it on first call.
         """
-        if not self._resolved:
-            self._instance = self._container.resolve(
-                self._service_type, self._context_key
-            )
-            self._resolved = True
-        return self._instance
+        instance = self._instance
+        if instance is _UNRESOLVED:
+            instance = self._container.resolve(self._service_type, self._context_key)
+            self._instance = instance
+        return instance
 
     async def async_resolve(self) -> T:
         """Asynchronously resolve the dependency.
@@ -75,9 +92,10 @@ class Lazy(Generic[T]):
         Side Effects:
             Asynchronously resolves the dependency and caches it on first call.
         """
-        if not self._resolved:
-            self._instance = await self._container.resolve_async(
+        instance = self._instance
+        if instance is _UNRESOLVED:
+            instance = await self._container.resolve_async(
                 self._service_type, self._context_key
             )
-            self._resolved = True
-        return self._instance
+            self._instance = instance
+        return instance
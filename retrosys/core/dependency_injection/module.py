@@ -11,7 +11,18 @@ from .errors import DependencyNotFoundError
 if TYPE_CHECKING:
     from .container import Container
 
-import inspect
+# The Container class, imported on first use since container.py imports this module
+_container_class: Optional[Type["Container"]] = None
+
+
+def _get_container_class() -> Type["Container"]:
+    """Return the Container class, importing it the first time it is needed."""
+    global _container_class
+    if _container_class is None:
+        from .container import Container
+
+        _container_class = Container
+    return _container_class
 
 
 class Module:
@@ -39,9 +50,7 @@ class Module:
             name: Optional name for the module, used for identification when registered
                 with a parent container. Defaults to an empty string.
         """
-        from .container import Container
-
-        self._container = Container()
+        self._container = _get_container_class()()
         self.parent_container: Optional["Container"] = None
         self.name = name
 
@@ -136,11 +145,9 @@ class Module:
             Module: The module instance for method chaining.
 
         Side Effects:
-            Automatically detects if the factory is a coroutine function and sets
-            is_async accordingly.
+            The module's container detects if the factory is a coroutine function and
+            sets is_async accordingly.
         """
-        if inspect.iscoroutinefunction(factory):
-            is_async = True
         self._container.register_factory(service_type, factory, lifecycle, is_async)
         return self
 
@@ -179,8 +186,7 @@ class Module:
                 or its parent container.
         """
         # First check local module container
-        descriptor = self._container._get_descriptor(service_type, context_key)
-        if descriptor:
+        if self._container.has_descriptor(service_type, context_key):
             return self._container.resolve(service_type, context_key)
 
         # Then check parent container if available
@@ -211,8 +217,7 @@ class Module:
                 or its parent container.
         """
 
-        descriptor = self._container._get_descriptor(service_type, context_key)
-        if descriptor:
+        if self._container.has_descriptor(service_type, context_key):
             return await self._container.resolve_async(service_type, context_key)
 
         if self.parent_container:
@@ -1,26 +1,80 @@
-from typing import Dict, Any, Type, Tuple
+from typing import Dict, Any, Optional, Type, Tuple, TYPE_CHECKING
 from .project_types import T, Lifecycle, ContainerProtocol
 import inspect
 
+if TYPE_CHECKING:
+    from .service_descriptor import ServiceDescriptor
+
+# Marks a cache miss in Scope._instances, where None is a valid cached instance
+_MISS = object()
+
 
 class Scope:
     """Represents a dependency injection scope."""
 
+    __slots__ = ("_parent", "_container", "_instances", "_descriptors", "__weakref__")
+
     def __init__(self, parent_container: ContainerProtocol):
         """Initialize a new dependency injection scope.
 
-        Creates a new scope with its own container that inherits from the parent
-        container. The scope maintains a cache of resolved service instances.
+        Creates a new scope whose non-singleton services are built by a child
+        container of the parent container. The child is only created on the first
+        resolve that needs it, so a scope that only reads singletons never creates
+        one. The scope maintains a cache of resolved service instances, and of the
+        descriptors looked up to decide which instances to keep.
 
         Args:
             parent_container (ContainerProtocol): The parent container that this
                 scope will create a child container from.
-
-        Side Effects:
-            Creates a child container from the parent container.
         """
-        self._container = parent_container.create_child_container()
+        self._parent = parent_container
+        self._container: Optional[ContainerProtocol] = None
         self._instances: Dict[Tuple[Type, str], Any] = {}  # Changed to use Type+context_key as key
+        self._descriptors: Dict[Tuple[Type, str], "ServiceDescriptor"] = {}
+
+    def _get_descriptor(
+        self, cache_key: Tuple[Type, str]
+    ) -> Optional["ServiceDescriptor"]:
+        """Get the parent's descriptor for a (type, context key) pair, cached per scope.
+
+        Types the child container registered just in time are not visible here, so
+        a descriptor returned by this method always belongs to the parent.
+        """
+        descriptor = self._descriptors.get(cache_key)
+        if descriptor is None:
+            descriptor = self._parent._get_descriptor(*cache_key)
+            if descriptor is not None:
+                self._descriptors[cache_key] = descriptor
+        return descriptor
+
+    def _resolver(self, cache_key: Tuple[Type, str]) -> ContainerProtocol:
+        """Get the container to resolve a (type, context key) pair from.
+
+        Singletons registered with the parent live there, so they are resolved
+        there directly; everything else, including types the child registers just
+        in time, goes through the scope's child container, created here on first use.
+        """
+        descriptor = self._get_descriptor(cache_key)
+        if descriptor is not None and descriptor.lifecycle is Lifecycle.SINGLETON:
+            return self._parent
+        container = self._container
+        if container is None:
+            container = self._container = self._parent.create_child_container()
+        return container
+
+    def _keep(self, cache_key: Tuple[Type, str], instance: Any) -> Any:
+        """Cache a freshly resolved instance if it is scoped, then return it."""
+        descriptor = self._get_descriptor(cache_key)
+        if descriptor is None and self._container is not None:
+            # Registered just in time by the child. Only scoped descriptors are
+            # remembered (dispose needs them); a singleton's must keep routing
+            # resolves to the child that holds its instance.
+            descriptor = self._container._get_descriptor(*cache_key)
+            if descriptor is not None and descriptor.lifecycle is Lifecycle.SCOPED:
+                self._descriptors[cache_key] = descriptor
+        if descriptor and descriptor.lifecycle is Lifecycle.SCOPED:
+            self._instances[cache_key] = instance
+        return instance
 
     def resolve(self, service_type: Type[T], context_key: str = "") -> T:
         """Resolves a service instance within the current scope.
@@ -43,17 +97,13 @@ class Scope:
             scoped lifecycle.
         """
         cache_key = (service_type, context_key)  # Create composite key with type and context
-        if cache_key in self._instances:
-            return self._instances[cache_key]
-
-        instance = self._container.resolve(service_type, context_key)
+        instance = self._instances.get(cache_key, _MISS)
+        if instance is not _MISS:
+            return instance
 
-        # Cache scoped instances
-        descriptor = self._container._get_descriptor(service_type, context_key)
-        if descriptor and descriptor.lifecycle == Lifecycle.SCOPED:
-            self._instances[cache_key] = instance
-
-        return instance
+        return self._keep(
+            cache_key, self._resolver(cache_key).resolve(service_type, context_key)
+        )
 
     async def resolve_async(self, service_type: Type[T], context_key: str = "") -> T:
         """Asynchronously resolves a service instance within the current scope.
@@ -76,17 +126,14 @@ class Scope:
             scoped lifecycle.
         """
         cache_key = (service_type, context_key)  # Create composite key with type and context
-        if cache_key in self._instances:
-            return self._instances[cache_key]
+        instance = self._instances.get(cache_key, _MISS)
+        if instance is not _MISS:
+            return instance
 
-        instance = await self._container.resolve_async(service_type, context_key)
-
-        # Cache scoped instances
-        descriptor = self._container._get_descriptor(service_type, context_key)
-        if descriptor and descriptor.lifecycle == Lifecycle.SCOPED:
-            self._instances[cache_key] = instance
-
-        return instance
+        resolver = self._resolver(cache_key)
+        return self._keep(
+            cache_key, await resolver.resolve_async(service_type, context_key)
+        )
 
     async def __aenter__(self) -> "Scope":
         """Async context manager entry point.
@@ -123,41 +170,49 @@ class Scope:
         Finally, it clears the instances cache.
 
         The method handles both synchronous and asynchronous dispose/on_destroy methods.
+        on_destroy is awaited only when it is a coroutine function, even for async
+        services.
 
         Side Effects:
             - Calls dispose methods on service instances if available
             - Calls on_destroy handlers from service descriptors if available
             - Catches and logs any exceptions during disposal
-            - Clears the internal instances cache
+            - Empties the internal instances cache
         """
-        for (service_type, context_key), instance in list(self._instances.items()):
-            descriptor = self._container._get_descriptor(service_type, context_key)
-            if descriptor and descriptor.lifecycle == Lifecycle.SCOPED:
-                if hasattr(instance, "dispose"):
-                    try:
-                        dispose_method = instance.dispose
-                        if inspect.iscoroutinefunction(dispose_method):
-                            await dispose_method()
-                        else:
-                            dispose_method()
-                    except Exception as e:
-                        # Log error but continue disposing other instances
-                        import logging
-
-                        logging.getLogger(__name__).error(
-                            f"Error disposing instance of {service_type}: {e}"
-                        )
-                elif descriptor.on_destroy:
-                    try:
-                        if inspect.iscoroutinefunction(descriptor.on_destroy):
-                            await descriptor.on_destroy(instance)
-                        else:
-                            descriptor.on_destroy(instance)
-                    except Exception as e:
-                        # Log error but continue disposing other instances
-                        import logging
-
-                        logging.getLogger(__name__).error(
-                            f"Error in on_destroy for {service_type}: {e}"
-                        )
-        self._instances.clear()
+        # Detach the cache instead of copying it: instances resolved while a
+        # dispose hook runs go into a fresh dict rather than the one being walked
+        instances, self._instances = self._instances, {}
+        for cache_key, instance in instances.items():
+            # Only scoped instances are cached, and only after their descriptor
+            # was looked up, so the scope already holds every descriptor needed
+            service_type = cache_key[0]
+            descriptor = self._descriptors[cache_key]
+            # One attribute lookup serves as both the existence check and the
+            # bound method to call
+            dispose_method = getattr(instance, "dispose", None)
+            if dispose_method is not None:
+                try:
+                    if inspect.iscoroutinefunction(dispose_method):
+                        await dispose_method()
+                    else:
+                        dispose_method()
+                except Exception as e:
+                    # Log error but continue disposing other instances
+                    import logging
+
+                    logging.getLogger(__name__).error(
+                        f"Error disposing instance of {service_type}: {e}"
+                    )
+            elif descriptor.on_destroy:
+                try:
+                    if descriptor.on_destroy_is_coroutine:
+                        await descriptor.on_destroy(instance)
+                    else:
+                        descriptor.on_destroy(instance)
+                except Exception as e:
+                    # Log error but continue disposing other instances
+                    import logging
+
+                    logging.getLogger(__name__).error(
+                        f"Error in on_destroy for {service_type}: {e}"
+                    )
@@ -1,3 +1,5 @@
+import inspect
+import sys
 from typing import Type, Optional, Callable, Awaitable, Dict, Any, Union
 from dataclasses import dataclass, field
 from retrosys.core.dependency_injection.project_types import (
@@ -7,8 +9,14 @@ from retrosys.core.dependency_injection.project_types import (
     AsyncFactoryCallable,
 )
 
+# Descriptors are read on every resolve; store their fields in slots where
+# dataclasses can also keep weak reference support (Python 3.11+)
+_DATACLASS_OPTIONS = (
+    {"slots": True, "weakref_slot": True} if sys.version_info >= (3, 11) else {}
+)
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ServiceDescriptor:
     """Describes a registered service."""
 
@@ -34,6 +42,35 @@ class ServiceDescriptor:
     )  # field to ensure a dict for each instance
     method_injections: Dict[str, Dict[str, Type]] = field(default_factory=dict)
 
+    # Whether each lifecycle hook's result must be awaited, decided once here
+    on_init_is_async: bool = field(default=False, init=False, repr=False)
+    on_destroy_is_async: bool = field(default=False, init=False, repr=False)
+    # Whether on_destroy itself is a coroutine function; scopes await only these
+    on_destroy_is_coroutine: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self):
+        # Hooks of async services are awaited even when they are plain callables
+        # returning a coroutine, such as lambdas
+        self.on_init_is_async = self.is_async or inspect.iscoroutinefunction(
+            self.on_init
+        )
+        self.on_destroy_is_coroutine = inspect.iscoroutinefunction(self.on_destroy)
+        self.on_destroy_is_async = self.is_async or self.on_destroy_is_coroutine
+
+    def bulk_update_injections(
+        self,
+        property_injections: Dict[str, Type],
+        method_injections: Dict[str, Dict[str, Type]],
+    ) -> None:
+        """Merges property and method injection maps into this descriptor.
+
+        Args:
+            property_injections: Mapping of property names to the service types to inject.
+            method_injections: Mapping of method names to their parameter-to-type maps.
+        """
+        self.property_injections.update(property_injections)
+        self.method_injections.update(method_injections)
+
     def is_resolved(self) -> bool:
         """Determines if the service instance has been resolved/initialized.
 
@@ -49,6 +86,6 @@ class ServiceDescriptor:
 
         return (
             self.instance is not None
-            if self.lifecycle == Lifecycle.SINGLETON
+            if self.lifecycle is Lifecycle.SINGLETON
             else False
         )
@@ -20,6 +20,25 @@ except FileNotFoundError:
         "myst-parser>=0.15.0"
     ]
 
+# Optionally compile the modules on the resolution hot path with mypyc:
+#   pip install mypy && RETROSYS_USE_MYPYC=1 pip install --no-build-isolation .
+# The pure-Python sources are used by default and stay importable as a fallback.
+ext_modules = []
+if os.environ.get("RETROSYS_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            "retrosys/core/dependency_injection/lazy.py",
+            # scope.py stays pure Python: mypyc ignores the __weakref__ slot
+            # of native classes, so a compiled Scope could not be weakly
+            # referenced
+            "retrosys/core/dependency_injection/module.py",
+            # Only the compiled modules need to type-check cleanly
+            "--follow-imports=silent",
+        ]
+    )
+
 setuptools.setup(
     name="retrosys-core",
     version="0.1.0", 
@@ -47,4 +66,5 @@ setuptools.setup(
     extras_require={
         "docs": docs_requirements,
     },
+    ext_modules=ext_modules,
 )
\ No newline at end of file
@@ -1,6 +1,10 @@
 import pytest
 import asyncio
 import inspect
+import time
+import weakref
+from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Any, Awaitable, Union, Generic, TypeVar
 
 from retrosys.core.dependency_injection import Container, Lifecycle, ResolutionStrategy
@@ -11,6 +15,7 @@ from retrosys.core.dependency_injection.errors import (
 )
 from retrosys.core.dependency_injection.lazy import Lazy
 from retrosys.core.dependency_injection.module import Module
+from retrosys.core.dependency_injection.service_descriptor import ServiceDescriptor
 
 # Helper for testing forward references
 T = TypeVar('T')
@@ -159,7 +164,80 @@ class TestContainer:
         assert default.value == "default"
         assert context1.value == "context1"
         assert context2.value == "context2"
-    
+
+    def test_str_enum_context_key(self):
+        """Test that str subclasses such as str-based enum members work as context keys."""
+        # Arrange
+        container = Container()
+
+        class Region(str, Enum):
+            EU = "eu"
+
+        class Service:
+            def __init__(self, value=None):
+                self.value = value or "default"
+
+        container.register(Service)
+        container.register(
+            Service, factory=lambda c: Service("eu"), context_key=Region.EU
+        )
+
+        # Act
+        by_member = container.resolve(Service, Region.EU)
+        by_value = container.resolve(Service, "eu")
+        lazy = container.lazy_resolve(Service, Region.EU)
+
+        # Assert
+        assert by_member.value == "eu"
+        assert by_value is by_member
+        assert lazy() is by_member
+
+    def test_cached_singleton_refreshed_by_new_registration(self):
+        """Test that a later registration is honored after a singleton was cached."""
+        # Arrange
+        container = Container()
+
+        class Service:
+            def __init__(self, value=None):
+                self.value = value or "default"
+
+        container.register(Service)
+
+        # Act - unknown context falls back to the default registration
+        fallback = container.resolve(Service, "special")
+        container.register(
+            Service, factory=lambda c: Service("special"), context_key="special"
+        )
+        special = container.resolve(Service, "special")
+
+        # Assert
+        assert fallback.value == "default"
+        assert special.value == "special"
+        assert container.resolve(Service) is fallback
+
+    def test_singleton_built_once_across_threads(self):
+        """Test that concurrent threads resolving a singleton share one instance."""
+        # Arrange
+        container = Container()
+        created = []
+
+        class SlowService:
+            def __init__(self):
+                time.sleep(0.01)  # Widen the window for a racing thread
+                created.append(self)
+
+        container.register(SlowService)
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(lambda _: container.resolve(SlowService), range(8))
+            )
+
+        # Assert
+        assert len(created) == 1
+        assert all(result is created[0] for result in results)
+
     def test_constructor_injection(self):
         """Test constructor dependency injection."""
         # Arrange
@@ -210,7 +288,109 @@ class TestContainer:
         # Should raise error if using synchronous resolve
         with pytest.raises(AsyncInitializationError):
             error_container.resolve(AsyncService)
-        
+
+    @pytest.mark.asyncio
+    async def test_concurrent_async_resolution_is_not_circular(self):
+        """Test that concurrent tasks resolving one type don't share a resolution stack."""
+        # Arrange
+        container = Container()
+
+        class Connection:
+            pass
+
+        async def connect(c):
+            await asyncio.sleep(0.01)  # Let the other task start resolving
+            return Connection()
+
+        container.register(
+            Connection, factory=connect, lifecycle=Lifecycle.TRANSIENT, is_async=True
+        )
+
+        # Act
+        first, second = await asyncio.gather(
+            container.resolve_async(Connection), container.resolve_async(Connection)
+        )
+
+        # Assert
+        assert isinstance(first, Connection)
+        assert isinstance(second, Connection)
+
+    @pytest.mark.asyncio
+    async def test_factory_gathering_shared_dependency_is_not_circular(self):
+        """Test that tasks spawned by a factory don't share the factory's resolution chain."""
+        # Arrange
+        container = Container()
+
+        class Clock:
+            pass
+
+        class ReaderA:
+            def __init__(self, clock):
+                self.clock = clock
+
+        class ReaderB:
+            def __init__(self, clock):
+                self.clock = clock
+
+        class Report:
+            def __init__(self, a, b):
+                self.a = a
+                self.b = b
+
+        async def create_clock(c):
+            await asyncio.sleep(0.01)  # Let the sibling task start resolving Clock
+            return Clock()
+
+        async def create_a(c):
+            return ReaderA(await c.resolve_async(Clock))
+
+        async def create_b(c):
+            return ReaderB(await c.resolve_async(Clock))
+
+        async def create_report(c):
+            a, b = await asyncio.gather(
+                c.resolve_async(ReaderA), c.resolve_async(ReaderB)
+            )
+            return Report(a, b)
+
+        container.register(
+            Clock, factory=create_clock, lifecycle=Lifecycle.TRANSIENT, is_async=True
+        )
+        container.register(ReaderA, factory=create_a, is_async=True)
+        container.register(ReaderB, factory=create_b, is_async=True)
+        container.register(Report, factory=create_report, is_async=True)
+
+        # Act
+        report = await container.resolve_async(Report)
+
+        # Assert
+        assert isinstance(report.a.clock, Clock)
+        assert isinstance(report.b.clock, Clock)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_async_singleton_resolution_shares_instance(self):
+        """Test that tasks racing to build an async singleton all get the same one."""
+        # Arrange
+        container = Container()
+
+        class Pool:
+            pass
+
+        async def create_pool(c):
+            await asyncio.sleep(0.01)  # Let the other task start building too
+            return Pool()
+
+        container.register(Pool, factory=create_pool, is_async=True)
+
+        # Act
+        first, second = await asyncio.gather(
+            container.resolve_async(Pool), container.resolve_async(Pool)
+        )
+
+        # Assert
+        assert first is second
+        assert await container.resolve_async(Pool) is first
+
     @pytest.mark.asyncio
     async def test_async_initialization(self):
         """Test async initialization after instance creation."""
@@ -235,7 +415,27 @@ class TestContainer:
         # Assert
         assert init_called, "on_init should have been called"
         assert instance.initialized, "Instance should be initialized"
-    
+
+    @pytest.mark.asyncio
+    async def test_async_constructor_detected_at_registration(self):
+        """Test that a class with an async __init__ is registered as async."""
+        # Arrange
+        container = Container()
+
+        class Service:
+            async def __init__(self):
+                await asyncio.sleep(0)
+                self.ready = True
+
+        # Act
+        container.register(Service)
+
+        # Assert
+        with pytest.raises(AsyncInitializationError):
+            container.resolve(Service)
+        instance = await container.resolve_async(Service)
+        assert instance.ready is True
+
     def test_lazy_dependency(self):
         """Test lazy dependency resolution."""
         # Arrange
@@ -399,7 +599,34 @@ class TestContainer:
         # Assert
         assert dispose_called, "Synchronous on_destroy should have been called"
         assert async_dispose_called, "Asynchronous on_destroy should have been called"
-    
+
+    @pytest.mark.asyncio
+    async def test_async_hooks_on_sync_service_are_awaited(self):
+        """Test that coroutine hooks are awaited even if the service is not async."""
+        # Arrange
+        container = Container()
+        events = []
+
+        class Service:
+            pass
+
+        async def on_init(instance):
+            await asyncio.sleep(0)
+            events.append("init")
+
+        async def on_destroy(instance):
+            await asyncio.sleep(0)
+            events.append("destroy")
+
+        container.register(Service, on_init=on_init, on_destroy=on_destroy)
+
+        # Act
+        await container.resolve_async(Service)
+        await container.dispose()
+
+        # Assert
+        assert events == ["init", "destroy"]
+
     def test_test_mode_and_mocking(self):
         """Test the test mode and mocking functionality."""
         # Arrange
@@ -435,6 +662,38 @@ class TestContainer:
         assert not container._test_mode, "Test mode should be disabled"
         assert not container._mock_instances, "Mock instances should be cleared"
     
+    def test_lazy_singleton_dependency_follows_mocks(self):
+        """Test that lazily injected singletons honour mocks added or removed later."""
+        # Arrange
+        container = Container()
+
+        class Repo:
+            pass
+
+        class MockRepo:
+            pass
+
+        class Consumer:
+            def __init__(self, repo: Lazy[Repo]):
+                self.repo = repo
+
+        container.register(Repo)
+        container.register(Consumer, lifecycle=Lifecycle.TRANSIENT)
+        real = container.resolve(Consumer).repo()
+        mock = MockRepo()
+
+        # Act
+        container.enable_test_mode()
+        container.mock(Repo, mock)
+        in_test_mode = container.resolve(Consumer).repo()
+        container.disable_test_mode()
+        after_test_mode = container.resolve(Consumer).repo()
+
+        # Assert
+        assert isinstance(real, Repo)
+        assert in_test_mode is mock
+        assert after_test_mode is real
+
     def test_forward_references(self):
         """Test resolution of forward references in string annotations."""
         # Arrange
@@ -496,7 +755,47 @@ class TestContainer:
             container.resolve(Service)
         
         assert "No registration found for Dependency" in str(excinfo.value)
-    
+
+    def test_container_supports_weak_references(self):
+        # Arrange
+        container = Container()
+
+        # Act
+        ref = weakref.ref(container)
+
+        # Assert
+        assert ref() is container
+
+    def test_service_descriptor_supports_weak_references(self):
+        # Arrange
+        descriptor = ServiceDescriptor(service_type=object)
+
+        # Act
+        ref = weakref.ref(descriptor)
+
+        # Assert
+        assert ref() is descriptor
+
+    def test_has_descriptor(self):
+        """Test probing for registrations without resolving."""
+        # Arrange
+        parent = Container()
+
+        class Registered:
+            pass
+
+        class Missing:
+            pass
+
+        parent.register(Registered)
+        child = parent.create_child_container()
+
+        # Act & Assert
+        assert parent.has_descriptor(Registered)
+        assert parent.has_descriptor(Registered, "unknown")  # Falls back to default
+        assert child.has_descriptor(Registered)
+        assert not parent.has_descriptor(Missing)
+
     def test_child_container(self):
         """Test creating and using a child container."""
         # Arrange
@@ -531,7 +830,105 @@ class TestContainer:
         # Parent shouldn't have child's registrations
         with pytest.raises(DependencyNotFoundError):
             parent.resolve(ChildService)
-    
+
+    def test_child_container_falls_through_to_parent(self):
+        """Test that a child sees later parent registrations and can override them."""
+        # Arrange
+        parent = Container()
+        child = parent.create_child_container()
+
+        class Service:
+            def __init__(self, value="parent"):
+                self.value = value
+
+        class Late:
+            pass
+
+        parent.register(Service)
+        child.register(Service, factory=lambda c: Service("child"))
+
+        # Act - registered on the parent after the child was created
+        parent.register(Late)
+
+        # Assert
+        assert child.resolve(Service).value == "child"
+        assert parent.resolve(Service).value == "parent"
+        assert child.resolve(Late) is parent.resolve(Late)
+
+    def test_child_container_sees_parent_registration_after_caching(self):
+        """Test that a parent registration replaces what a child had already cached."""
+        # Arrange
+        parent = Container()
+        child = parent.create_child_container()
+
+        class Base:
+            pass
+
+        class Impl1(Base):
+            pass
+
+        class Impl2(Base):
+            pass
+
+        parent.register(Base, Impl1)
+        child.register(Impl1)  # The child has registrations of its own too
+        before = child.resolve(Base, "x")
+
+        # Act
+        parent.register(Base, Impl2, context_key="x")
+        after = child.resolve(Base, "x")
+
+        # Assert
+        assert isinstance(before, Impl1)
+        assert isinstance(after, Impl2)
+
+    def test_child_container_prefers_parent_keyed_match_over_own_default(self):
+        """Test that an exact context key match in the parent beats a child default."""
+        # Arrange
+        parent = Container()
+        child = parent.create_child_container()
+
+        class Service:
+            def __init__(self, value="default"):
+                self.value = value
+
+        parent.register(Service, factory=lambda c: Service("parent-k"), context_key="k")
+        child.register(Service, factory=lambda c: Service("child-default"))
+
+        # Act
+        keyed = child.resolve(Service, "k")
+        default = child.resolve(Service)
+
+        # Assert
+        assert keyed.value == "parent-k"
+        assert default.value == "child-default"
+
+    def test_child_container_resolves_forward_reference_to_parent_type(self):
+        """Test that a child with its own registrations sees parent types in forward references."""
+        # Arrange
+        parent = Container()
+        child = parent.create_child_container()
+
+        class Dependency:
+            pass
+
+        class Local:
+            pass
+
+        class Consumer:
+            def __init__(self, dependency: "Dependency"):
+                self.dependency = dependency
+
+        parent.register(Dependency)
+        child.register(Local)
+        child.register(Consumer)
+
+        # Act
+        consumer = child.resolve(Consumer)
+
+        # Assert
+        assert consumer.dependency is parent.resolve(Dependency)
+
     def test_module_integration(self):
         """Test integration with modules."""
         # Arrange
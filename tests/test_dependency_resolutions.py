@@ -1,5 +1,6 @@
 import pytest
 import asyncio
+import weakref
 from typing import List, Optional, Generic, TypeVar
 
 from retrosys.core.dependency_injection import (
@@ -9,6 +10,50 @@ from retrosys.core.dependency_injection.errors import (
     CircularDependencyError, DependencyNotFoundError
 )
 
+class TestInjectableDecorator:
+    def test_injectable_metadata_drives_auto_registration(self):
+        # Arrange
+        container = Container()
+
+        @injectable(lifecycle=Lifecycle.TRANSIENT)
+        class Worker:
+            pass
+
+        # Act
+        first = container.resolve(Worker)
+        second = container.resolve(Worker)
+
+        # Assert
+        assert Worker.__di_meta__.lifecycle is Lifecycle.TRANSIENT
+        assert Worker.__di_meta__.is_async is False
+        assert isinstance(first, Worker)
+        assert first is not second
+
+    def test_injectable_detects_async_init(self):
+        @injectable()
+        class AsyncWorker:
+            async def __init__(self):
+                pass
+
+        assert AsyncWorker.__di_meta__.is_async is True
+
+    @pytest.mark.asyncio
+    async def test_injectable_auto_registers_on_async_resolve(self):
+        # Arrange
+        container = Container()
+
+        @injectable()
+        class Worker:
+            pass
+
+        # Act
+        first = await container.resolve_async(Worker)
+        second = container.resolve(Worker)
+
+        # Assert
+        assert isinstance(first, Worker)
+        assert first is second
+
 class TestPropertyInjection:
     def test_property_injection(self):
     # Arrange
@@ -63,6 +108,48 @@ class TestMethodInjection:
         # Assert
         assert resolved.logger_used is True
 
+    def test_method_injection_uses_alternate_container_attribute(self):
+        # Arrange
+        container = Container()
+
+        class Logger:
+            pass
+
+        class Service:
+            def __init__(self, c):
+                self._di_container = c
+
+            @inject_method({"logger": Logger})
+            def get_logger(self, logger: Logger) -> Logger:
+                return logger
+
+        container.register(Logger)
+        service = Service(container)
+        explicit = Logger()
+
+        # Act & Assert
+        assert service.get_logger() is container.resolve(Logger)
+        assert service.get_logger(logger=explicit) is explicit
+
+    def test_method_injection_without_container_uses_shared_fallback(self):
+        # Arrange
+        @injectable()
+        class Clock:
+            pass
+
+        class Plain:
+            @inject_method({"clock": Clock})
+            def get_clock(self, clock: Clock) -> Clock:
+                return clock
+
+        # Act
+        first = Plain().get_clock()
+        second = Plain().get_clock()
+
+        # Assert - injectable singleton is resolved just in time and reused
+        assert isinstance(first, Clock)
+        assert first is second
+
 class TestLazyDependencies:
     def test_lazy_dependency_not_resolved_immediately(self):
         # Arrange
@@ -114,6 +201,39 @@ class TestLazyDependencies:
         assert instance1 is instance2  # Same instance returned
         assert instance1.id == instance2.id
     
+    def test_lazy_singleton_wrapper_shared_between_consumers(self):
+        # Arrange
+        container = Container()
+
+        class SingletonService:
+            pass
+
+        class Consumer:
+            def __init__(self, lazy_dep: Lazy[SingletonService]):
+                self.lazy_dep = lazy_dep
+
+        container.register(SingletonService)
+        container.register(Consumer, lifecycle=Lifecycle.TRANSIENT)
+
+        # Act
+        first = container.resolve(Consumer)
+        second = container.resolve(Consumer)
+
+        # Assert
+        assert first is not second
+        assert first.lazy_dep is second.lazy_dep
+        assert first.lazy_dep() is container.resolve(SingletonService)
+
+    def test_lazy_supports_weak_references(self):
+        # Arrange
+        lazy = Container().lazy_resolve(int)
+
+        # Act
+        ref = weakref.ref(lazy)
+
+        # Assert
+        assert ref() is lazy
+
     def test_transient_lazy_dependencies(self):
         # Arrange
         container = Container()
@@ -286,4 +286,44 @@ class TestModuleDecorator:
         
         # Assert - verify that the property injection worked
         result = user_service.create_user("testuser")
-        assert result == "LOG: Created user testuser"
\ No newline at end of file
+        assert result == "LOG: Created user testuser"
+
+    def test_module_decorator_registers_inherited_injectables(self):
+        # Arrange
+        container = Container()
+
+        class BaseModule:
+            @injectable()
+            class Shared:
+                pass
+
+        # Act
+        @register_module(container)
+        class FeatureModule(BaseModule):
+            @injectable()
+            class Feature:
+                pass
+
+        # Assert - checked without resolving, which would register them just in time
+        assert container.has_descriptor(FeatureModule.Feature)
+        assert container.has_descriptor(BaseModule.Shared)
+
+    def test_module_decorator_registers_subclasses_of_injectables(self):
+        # Arrange
+        container = Container()
+
+        @injectable()
+        class Base:
+            pass
+
+        # Act
+        @register_module(container)
+        class AppModule:
+            Injectable = Base
+
+            class Derived(Base):
+                pass
+
+        # Assert - checked without resolving, which would register them just in time
+        assert container.has_descriptor(Base)
+        assert container.has_descriptor(AppModule.Derived)
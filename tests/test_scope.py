@@ -1,6 +1,7 @@
 import pytest
 import logging
-from retrosys.core.dependency_injection import Container, Lifecycle, Scope
+import weakref
+from retrosys.core.dependency_injection import Container, Lifecycle, Scope, injectable
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -63,6 +64,68 @@ class TestScope:
         scoped2 = scope2.resolve(ScopedService)
         assert scoped1 is not scoped2
         
+    def test_singleton_only_scope_resolves_from_parent(self):
+        # Arrange
+        container = Container()
+
+        class SingletonService:
+            pass
+
+        class ScopedService:
+            pass
+
+        container.register(SingletonService, lifecycle=Lifecycle.SINGLETON)
+        container.register(ScopedService, lifecycle=Lifecycle.SCOPED)
+        scope = container.create_scope()
+
+        # Act
+        singleton = scope.resolve(SingletonService)
+
+        # Assert - no child container is needed until a scoped service is resolved
+        assert singleton is container.resolve(SingletonService)
+        assert scope._container is None
+        assert scope.resolve(ScopedService) is scope.resolve(ScopedService)
+        assert scope._container is not None
+
+    @pytest.mark.asyncio
+    async def test_unregistered_injectables_in_scope(self):
+        # Arrange
+        container = Container()
+
+        @injectable()
+        class Clock:
+            pass
+
+        @injectable(lifecycle=Lifecycle.SCOPED)
+        class Session:
+            def __init__(self):
+                self.closed = False
+
+            def dispose(self):
+                self.closed = True
+
+        scope = container.create_scope()
+
+        # Act
+        first_clock = scope.resolve(Clock)
+        second_clock = scope.resolve(Clock)
+        session = scope.resolve(Session)
+        await scope.dispose()
+
+        # Assert - registered just in time by the scope, yet still one per scope
+        assert first_clock is second_clock
+        assert session.closed
+
+    def test_scope_supports_weak_references(self):
+        # Arrange
+        scope = Container().create_scope()
+
+        # Act
+        ref = weakref.ref(scope)
+
+        # Assert
+        assert ref() is scope
+
     @pytest.mark.asyncio
     async def test_async_scope_context_manager(self):
         # Arrange
@@ -194,6 +194,58 @@ class TestScopeAsync:
         assert sync_disposed, "Sync service should be disposed"
         assert async_disposed, "Async service should be disposed"
 
+    @pytest.mark.asyncio
+    async def test_resolve_during_disposal(self):
+        """Test that a dispose method may resolve from the scope being disposed."""
+        # Arrange
+        container = Container()
+        scope = container.create_scope()
+        late_services = []
+
+        class LateService:
+            pass
+
+        class Closer:
+            async def dispose(self):
+                late_services.append(scope.resolve(LateService))
+
+        container.register(Closer, lifecycle=Lifecycle.SCOPED)
+        container.register(LateService, lifecycle=Lifecycle.SCOPED)
+        scope.resolve(Closer)
+
+        # Act
+        await scope.dispose()
+
+        # Assert
+        assert len(late_services) == 1
+        assert isinstance(late_services[0], LateService)
+
+    @pytest.mark.asyncio
+    async def test_sync_on_destroy_of_async_service(self, caplog):
+        """Test that a plain on_destroy of an async scoped service is called, not awaited."""
+        # Arrange
+        container = Container()
+        destroyed = []
+
+        class AsyncService:
+            async def __init__(self):
+                pass
+
+        container.register(
+            AsyncService,
+            lifecycle=Lifecycle.SCOPED,
+            on_destroy=lambda instance: destroyed.append(instance),
+        )
+        scope = container.create_scope()
+        service = await scope.resolve_async(AsyncService)
+
+        # Act
+        await scope.dispose()
+
+        # Assert
+        assert destroyed == [service]
+        assert "Error in on_destroy" not in caplog.text
+
     @pytest.mark.asyncio
     async def test_error_in_on_destroy_callback(self):
         """Test error handling in on_destroy callbacks."""